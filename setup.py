@@ -81,7 +81,7 @@ setup(
         "jupyter",
         "gif",
     ],
-    extras_require={"gui": ["pyqt5"],},
+    extras_require={"gui": ["pyqt5"], "numba": ["numba"],},
     setup_requires=["pytest-runner"],
     entry_points={
         "console_scripts": ["scml = scml.cli:main", "cliadv = scml.cliadv:cli",]
@@ -3,7 +3,30 @@ __email__ = "yasserfarouk@gmail.com"
 __version__ = "0.3.3"
 
 from .scml2019 import *
-from .scml2020 import *
+from . import scml2020
+
+# scml2020 symbols take precedence over scml2019 ones. The built-in scml2020
+# agents (and utils) are only imported on first access (see `__getattr__`)
+for _ in scml2020.__all__:
+    if _ in scml2020._lazy:
+        globals().pop(_, None)
+    else:
+        globals()[_] = getattr(scml2020, _)
+del _
+
 from .oneshot import *
 
+
+def __getattr__(name):
+    if name not in scml2020._lazy or name not in scml2020.__all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(scml2020, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(scml2020._lazy).intersection(scml2020.__all__))
+
+
 __all__ = scml2020.__all__ + oneshot.__all__
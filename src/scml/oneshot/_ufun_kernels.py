@@ -0,0 +1,58 @@
+"""
+Arithmetic kernels used by `OneShotUFun.from_aggregates_batch`.
+
+The kernels are compiled with numba if it is installed. Otherwise, they run as
+plain python/numpy functions with identical results. numba is only imported
+the first time a kernel is needed so that importing scml does not pay for it.
+Set the environment variable `SCML_NUMBA` to `0` to avoid importing numba
+altogether (e.g. to reduce the startup time of tournament workers).
+"""
+import os
+from functools import lru_cache
+
+import numpy as np
+
+__all__ = ["_eval_many", "_batch_kernel"]
+
+
+def _eval_many(qin, qout, pin, pout, lines, cost, storage, penalty):
+    """
+    Calculates the profits of arrays of aggregates.
+
+    Args:
+        qin: Input quantities.
+        qout: Output quantities.
+        pin: Input total prices.
+        pout: Output total prices.
+        lines: Number of production lines.
+        cost: Production cost per unit.
+        storage: Storage cost per unit of inputs not used (in money).
+        penalty: Delivery penalty per unit of outputs not delivered (in money).
+
+    Remarks:
+        - `qin`, `qout`, `pin` and `pout` are arrays of the same length and an
+          array of profits with that length is returned.
+    """
+    produced = np.minimum(np.minimum(qin, qout), lines)
+    sold = qout != 0
+    received = np.where(sold, pout * produced / np.where(sold, qout, 1), 0.0)
+    return (
+        received
+        - pin
+        - cost * produced
+        - storage * np.maximum(0, qin - qout)
+        - penalty * np.maximum(0, qout - qin)
+    )
+
+
+@lru_cache(maxsize=None)
+def _batch_kernel():
+    """Returns `_eval_many` compiled with numba if it is available and enabled"""
+    if os.environ.get("SCML_NUMBA", "1") == "1":
+        try:
+            from numba import njit
+        except ImportError:
+            pass
+        else:
+            return njit(cache=True, fastmath=True)(_eval_many)
+    return _eval_many
@@ -6,6 +6,7 @@ from typing import Any, Dict, List, Tuple
 
 import numpy as np
 from negmas import AgentWorldInterface
+from negmas import Contract
 from negmas.outcomes import Issue
 
 from ..scml2020 import FinancialReport
@@ -284,6 +285,13 @@ class OneShotAWI(AgentWorldInterface):
             self._world.current_step
         ]
 
+    @property
+    def current_signed_contracts(self) -> List[Contract]:
+        """
+        The contracts signed so far during this step (including exogenous contracts)
+        """
+        return self.agent.current_signed_contracts
+
     # =========================================================
     # Dynamic World Information (changes during the simulation)
     # =========================================================
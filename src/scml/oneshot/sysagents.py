@@ -26,6 +26,25 @@ __all__ = ["DefaultOneShotAdapter", "_SystemAgent"]
 class DefaultOneShotAdapter(Adapter):
     """The base class of all one-shot agents"""
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # contracts signed during the last step in which any contract was signed
+        self._signed_contracts: List[Contract] = []
+        self._signed_step = -1
+
+    def on_contract_signed(self, contract: Contract) -> None:
+        step = self.awi.current_step
+        if step != self._signed_step:
+            self._signed_contracts, self._signed_step = [], step
+        self._signed_contracts.append(contract)
+
+    @property
+    def current_signed_contracts(self) -> List[Contract]:
+        """Contracts signed so far during the current step"""
+        if self._signed_step != self.awi.current_step:
+            return []
+        return self._signed_contracts
+
     def on_negotiation_failure(self, partners, annotation, mechanism, state):
         return self._obj.on_negotiation_failure(partners, annotation, mechanism, state)
 
@@ -63,12 +82,14 @@ class DefaultOneShotAdapter(Adapter):
         super().init()
 
     def to_dict(self):
+        awi = self.awi
+        level = awi.my_input_product if awi else None
         return {
             "id": self.id,
             "name": self.name,
             "type": self.type_name,
-            "level": self.awi.my_input_product if self.awi else None,
-            "levels": [self.awi.my_input_product] if self.awi else None,
+            "level": level,
+            "levels": [level] if awi else None,
         }
 
     def _respond_to_negotiation_request(
@@ -81,7 +102,11 @@ class DefaultOneShotAdapter(Adapter):
         role: Optional[str],
         req_id: Optional[str],
     ) -> Optional[Negotiator]:
-        partner = [_ for _ in partners if _ != self.id][0]
+        my_id = self.id
+        if len(partners) == 2:
+            partner = partners[1] if partners[0] == my_id else partners[0]
+        else:
+            partner = [_ for _ in partners if _ != my_id][0]
         # self._obj.make_ufun()
         if not self._obj:
             return None
@@ -151,6 +176,9 @@ class _SystemAgent(DefaultOneShotAdapter):
     ) -> None:
         pass
 
+    def on_contract_signed(self, contract: Contract) -> None:
+        pass
+
     def sign_all_contracts(self, contracts: List[Contract]) -> List[Optional[str]]:
         """Signs all contracts"""
         return [self.id] * len(contracts)
@@ -1,11 +1,13 @@
 import warnings
 from typing import Iterable, Tuple, Union, List, Collection, Optional
 
+import numpy as np
 from negmas import Contract
 from negmas.utilities import UtilityFunction, UtilityValue
 from negmas.outcomes import Outcome, Issue
 
 from .common import QUANTITY, UNIT_PRICE, TIME
+from ._ufun_kernels import _batch_kernel
 
 __all__ = ["OneShotUFun"]
 
@@ -90,19 +92,42 @@ class OneShotUFun(UtilityFunction):
             return float("-inf")
         return self.from_offers([offer], [self._input_agent])
 
-    def from_contracts(self, contracts: Iterable[Contract]) -> float:
+    def from_contracts(
+        self,
+        contracts: Optional[Iterable[Contract]] = None,
+        assume_signed: bool = False,
+    ) -> float:
         """
         Calculates the utility function given a list of contracts
+
+        Args:
+            contracts: The contracts to evaluate. Unsigned contracts are ignored.
+                       If not given, the contracts signed by the agent during
+                       the current step are used.
+            assume_signed: If given, all contracts are assumed to be signed
+                           without checking them (e.g. when passing contracts
+                           collected as they were signed).
         """
-        offers, outputs = [], []
+        if contracts is None:
+            contracts, assume_signed = self._awi.current_signed_contracts, True
+        qin, qout, pin = 0, 0, 0
+        output_product = self._awi.my_output_product
         for c in contracts:
-            if c.signed_at < 0:
+            if not assume_signed and c.signed_at < 0:
                 continue
-            product = c.annotation["product"]
-            is_output = product == self._awi.my_output_product
-            outputs.append(is_output)
-            offers.append(self.outcome_as_tuple(c.agreement))
-        return self.from_offers(offers, outputs)
+            agreement = c.agreement
+            if isinstance(agreement, dict):
+                q, p = agreement["quantity"], agreement["unit_price"]
+            else:
+                q, p = agreement[QUANTITY], agreement[UNIT_PRICE]
+            if c.annotation["product"] == output_product:
+                qout += q
+            else:
+                qin += q
+                pin += p * q
+        # outputs beyond what can be produced from the inputs are not counted
+        qout = min(qout, qin, self._awi.n_lines)
+        return self.from_aggregates(qin, qout, pin, 0)
 
     @staticmethod
     def outcome_as_tuple(offer):
@@ -118,23 +143,18 @@ class OneShotUFun(UtilityFunction):
         """
         Calculates the utility value given a list of offers and whether each offer is for output or not.
         """
-        qin, qout, pin, pout = 0, 0, 0, 0
-        output_offers = []
+        qin, qout, pin = 0, 0, 0
         for offer, is_output in zip(offers, outputs):
-            offer = self.outcome_as_tuple(offer)
+            if isinstance(offer, dict):
+                offer = self.outcome_as_tuple(offer)
             if is_output:
-                output_offers.append(offer)
+                qout += offer[QUANTITY]
             else:
                 qin += offer[QUANTITY]
                 pin += offer[UNIT_PRICE] * offer[QUANTITY]
-        output_offers = sorted(output_offers, key=lambda x: -x[UNIT_PRICE])
-        producible = min(qin, self._awi.n_lines)
-        for offer in output_offers:
-            qout += offer[QUANTITY]
-            if qout >= producible:
-                qout = producible
-                break
-        return self.from_aggregates(qin, qout, pin, pout)
+        # outputs beyond what can be produced from the inputs are not counted
+        qout = min(qout, qin, self._awi.n_lines)
+        return self.from_aggregates(qin, qout, pin, 0)
 
     def from_aggregates(
         self,
@@ -171,12 +191,7 @@ class OneShotUFun(UtilityFunction):
         lines = self._awi.n_lines
         produced = min(qin, lines, qout)
         received = pout * produced / qout if qout else 0
-        if self._public_trading_prices:
-            tpi = self._awi._world.trading_prices[self._awi.my_input_product]  # type: ignore
-            tpo = self._awi._world.trading_prices[self._awi.my_output_product]  # type: ignore
-        else:
-            tpi = self._awi._world.catalog_prices[self._awi.my_input_product]  # type: ignore
-            tpo = self._awi._world.catalog_prices[self._awi.my_output_product]  # type: ignore
+        tpi, tpo = self._unit_prices()
         return (
             received
             - paid
@@ -185,6 +200,58 @@ class OneShotUFun(UtilityFunction):
             - self._delivery_penalty * tpo * max(0, qout - qin)
         )
 
+    def from_aggregates_batch(
+        self,
+        qin: np.ndarray,
+        qout: np.ndarray,
+        pin: np.ndarray,
+        pout: np.ndarray,
+    ) -> np.ndarray:
+        """
+        Calculates the utility for arrays of aggregates at once.
+
+        Args:
+            qin: Input quantities.
+            qout: Output quantities.
+            pin: Input total prices.
+            pout: Output total prices.
+
+        Returns:
+            An array of utilities with the same length as the inputs.
+
+        Remarks:
+            - This is an opt-in API for agents that score many candidate
+              aggregates at once. Nothing in the world or the built-in agents
+              calls it.
+            - Equivalent to calling `from_aggregates` for each set of
+              aggregates. It is only faster when tens of sets or more are
+              evaluated together. Use `from_aggregates` for a few of them.
+            - The calculation is compiled with numba if it is installed
+              (e.g. `pip install scml[numba]`).
+        """
+        tpi, tpo = self._unit_prices()
+        return _batch_kernel()(
+            np.asarray(qin, dtype=np.float64) + self._qin,
+            np.asarray(qout, dtype=np.float64) + self._qout,
+            np.asarray(pin, dtype=np.float64) + self._pin,
+            np.asarray(pout, dtype=np.float64) + self._pout,
+            self._awi.n_lines,
+            float(self._production_cost),
+            float(self._storage_cost * tpi),
+            float(self._delivery_penalty * tpo),
+        )
+
+    def _unit_prices(self) -> Tuple[float, float]:
+        """Returns the unit prices used to value storage costs and delivery penalties"""
+        if self._public_trading_prices:
+            prices = self._awi._world.trading_prices  # type: ignore
+        else:
+            prices = self._awi._world.catalog_prices  # type: ignore
+        return (
+            prices[self._awi.my_input_product],
+            prices[self._awi.my_output_product],
+        )
+
     def breach_level(self, qin: int = 0, qout: int = 0):
         """Calculates the breach level that would result from a given quantities"""
         qin += self._qin
@@ -5,6 +5,7 @@ The detailed description of this world simulation can be found here_.
 .. _here: http://www.yasserm.com/scml/scml2020.pdf
 
 """
+import importlib as _importlib
 
 from .common import *
 from .factory import *
@@ -12,9 +13,63 @@ from .awi import *
 from .world import *
 from .agent import *
 from .components import *
-from .agents import *
-from . import utils
-from .utils import *
+
+# The modules above import each other circularly and must be loaded in this
+# order. The built-in agents and the tournament utilities are only imported
+# when one of their symbols is first accessed (PEP 562).
+_lazy = {
+    **{
+        _: "agents"
+        for _ in (
+            "RandomAgent",
+            "DoNothingAgent",
+            "IndependentNegotiationsAgent",
+            "BuyCheapSellExpensiveAgent",
+            "DecentralizingAgent",
+            "MarketAwareDecentralizingAgent",
+            "IndDecentralizingAgent",
+            "MarketAwareIndDecentralizingAgent",
+            "DecentralizingAgentWithLogging",
+            "ReactiveAgent",
+            "MovingRangeAgent",
+            "MarketAwareMovingRangeAgent",
+        )
+    },
+    **{
+        _: "utils"
+        for _ in (
+            "anac2020_config_generator",
+            "anac2020_assigner",
+            "anac2020_world_generator",
+            "anac2020_tournament",
+            "anac2020_collusion",
+            "anac2020_std",
+            "balance_calculator2020",
+            "balance_calculator2021",
+            "balance_calculator2021oneshot",
+            "DefaultAgents",
+            "DefaultAgents2021",
+            "DefaultAgentsOneShot",
+        )
+    },
+    "agents": None,
+    "utils": None,
+}
+
+
+def __getattr__(name):
+    if name not in _lazy:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    if _lazy[name] is None:
+        value = _importlib.import_module(f".{name}", __name__)
+    else:
+        value = getattr(_importlib.import_module(f".{_lazy[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy))
 
 
 def builtin_agent_types(as_str=False):
@@ -27,6 +82,8 @@ def builtin_agent_types(as_str=False):
     """
     from negmas.helpers import get_class
 
+    from . import agents
+
     types = [
         f"scml.scml2020.agents.{_}" for _ in agents.__all__ if not _.startswith("Java")
     ]
@@ -37,7 +94,7 @@ def builtin_agent_types(as_str=False):
 
 __all__ = (
     common.__all__
-    + agents.__all__
+    + [_ for _, module in _lazy.items() if module == "agents"]
     + world.__all__
     + components.__all__
     + factory.__all__
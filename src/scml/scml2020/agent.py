@@ -335,6 +335,13 @@ class AWIHelper:
         """Cost of failure to deliver one unit (penalizes buying too little / selling too much)"""
         return self._owner.get_delivery_penalty()
 
+    @property
+    def current_signed_contracts(self) -> List[Contract]:
+        """
+        The contracts signed so far during this step (including exogenous contracts)
+        """
+        return self._owner.current_signed_contracts
+
     @property
     def current_input_issues(self) -> List[Issue]:
         if self.my_input_product == 0:
@@ -427,6 +434,22 @@ class OneShotAdapter(
             obj = instantiate(oneshot_type, **oneshot_params)
         super().__init__(obj=obj, name=name, type_postfix=type_postfix, ufun=ufun)
         obj.connect_to_2021_adapter(self, None)
+        # contracts signed during the last step in which any contract was signed
+        self._signed_contracts: List[Contract] = []
+        self._signed_step = -1
+
+    def on_contract_signed(self, contract: Contract) -> None:
+        step = self.awi.current_step
+        if step != self._signed_step:
+            self._signed_contracts, self._signed_step = [], step
+        self._signed_contracts.append(contract)
+
+    @property
+    def current_signed_contracts(self) -> List[Contract]:
+        """Contracts signed so far during the current step"""
+        if self._signed_step != self.awi.current_step:
+            return []
+        return self._signed_contracts
 
     def init(self):
         self._oneshot_awi = AWIHelper(self)
@@ -444,23 +444,29 @@ class SCML2020World(TimeInAgreementMixin, World):
         else:
             default_names = [unique_name("", add_time=False) for _ in range(n_agents)]
         if agent_name_reveals_type:
+            # short names are calculated once per type as most agents share types
+            short_names = dict()
             for i, (at, ap) in enumerate(zip(agent_types, agent_params)):
-                if issubclass(at, OneShotAdapter):
-                    s2 = (
-                        get_class(ap["oneshot_type"])
-                        ._type_name()
-                        .split(".")[-1]
-                        .replace("Agent", "")
-                        .replace("Adapter", "")
-                        .replace("OneShot", "")
-                    )
-                    s2 += f'O({at._type_name().split(".")[-1].replace("Agent", "").replace("OneShot", "").replace("Adapter", "")})'
-                else:
-                    s2 = at._type_name().split(".")[-1].replace("Agent", "")
-                s = "".join([c for c in s2 if c.isupper()])[:3]
-                if len(s) < 3:
-                    s = s[0] + s2[1 : 1 + (3 - len(s))] + s[1:]
-                default_names[i] += f"{s}"
+                is_adapter = issubclass(at, OneShotAdapter)
+                key = (at, ap["oneshot_type"]) if is_adapter else at
+                if key not in short_names:
+                    if is_adapter:
+                        s2 = (
+                            get_class(ap["oneshot_type"])
+                            ._type_name()
+                            .split(".")[-1]
+                            .replace("Agent", "")
+                            .replace("Adapter", "")
+                            .replace("OneShot", "")
+                        )
+                        s2 += f'O({at._type_name().split(".")[-1].replace("Agent", "").replace("OneShot", "").replace("Adapter", "")})'
+                    else:
+                        s2 = at._type_name().split(".")[-1].replace("Agent", "")
+                    s = "".join([c for c in s2 if c.isupper()])[:3]
+                    if len(s) < 3:
+                        s = s[0] + s2[1 : 1 + (3 - len(s))] + s[1:]
+                    short_names[key] = s
+                default_names[i] += short_names[key]
         agent_levels = [
             int(np.nonzero(np.max(p.costs != INFINITE_COST, axis=0).flatten())[0])
             for p in profiles
@@ -891,17 +897,15 @@ class SCML2020World(TimeInAgreementMixin, World):
         n_agents_cumsum = n_agents_per_process.cumsum().tolist()
         first_agent = [0] + n_agents_cumsum[:-1]
         last_agent = n_agents_cumsum[:-1] + [n_agents]
-        costs = INFINITE_COST * np.ones((n_agents, n_lines, n_processes), dtype=int)
-        for p, (f, l) in enumerate(zip(first_agent, last_agent)):
-            costs[f:l, :, p] = production_costs[f:l].reshape((l - f), 1)
-
-        process_of_agent = np.empty(n_agents, dtype=int)
-        for i, (f, l) in enumerate(zip(first_agent, last_agent)):
-            process_of_agent[f:l] = i
-            if cost_increases_with_level:
-                production_costs[f:l] = np.round(
-                    production_costs[f:l] * (i + 1)  # math.sqrt(i + 1)
-                ).astype(int)
+        process_of_agent = np.repeat(np.arange(n_processes), n_agents_per_process)
+        costs = np.full((n_agents, n_lines, n_processes), INFINITE_COST, dtype=int)
+        costs[np.arange(n_agents), :, process_of_agent] = production_costs.reshape(
+            (n_agents, 1)
+        )
+        if cost_increases_with_level:
+            production_costs[:] = np.round(
+                production_costs * (process_of_agent + 1)  # np.sqrt(process_of_agent + 1)
+            ).astype(int)
 
         # generate external contract amounts (controlled by productivity):
 
@@ -1033,19 +1037,24 @@ class SCML2020World(TimeInAgreementMixin, World):
         profile_info: List[
             Tuple[FactoryProfile, np.ndarray, np.ndarray, np.ndarray, np.ndarray]
         ] = []
+        # exogenous contracts for all agents are allocated once and every agent gets a view
+        all_esales = np.zeros((n_agents, n_steps, n_products), dtype=int)
+        all_esupplies = np.zeros((n_agents, n_steps, n_products), dtype=int)
+        all_esale_prices = np.zeros((n_agents, n_steps, n_products), dtype=int)
+        all_esupply_prices = np.zeros((n_agents, n_steps, n_products), dtype=int)
+        first_agents = slice(0, n_agents_per_process[0])
+        last_agents = slice(n_agents - n_agents_per_process[-1], n_agents)
+        all_esupplies[first_agents, :, 0] = np.asarray(exogenous_supplies).T
+        all_esupply_prices[first_agents, :, 0] = supply_prices
+        all_esales[last_agents, :, -1] = np.asarray(exogenous_sales).T
+        all_esale_prices[last_agents, :, -1] = sale_prices
         nxt = 0
         for l in range(n_processes):
             for a in range(n_agents_per_process[l]):
-                esales = np.zeros((n_steps, n_products), dtype=int)
-                esupplies = np.zeros((n_steps, n_products), dtype=int)
-                esale_prices = np.zeros((n_steps, n_products), dtype=int)
-                esupply_prices = np.zeros((n_steps, n_products), dtype=int)
-                if l == 0:
-                    esupplies[:, 0] = [exogenous_supplies[s][a] for s in range(n_steps)]
-                    esupply_prices[:, 0] = supply_prices[a, :]
-                if l == n_processes - 1:
-                    esales[:, -1] = [exogenous_sales[s][a] for s in range(n_steps)]
-                    esale_prices[:, -1] = sale_prices[a, :]
+                esales = all_esales[nxt]
+                esupplies = all_esupplies[nxt]
+                esale_prices = all_esale_prices[nxt]
+                esupply_prices = all_esupply_prices[nxt]
                 profile_info.append(
                     (
                         FactoryProfile(costs=costs[nxt]),
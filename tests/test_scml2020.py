@@ -49,9 +49,9 @@ def generate_world(
         )
     )
     for s1, s2 in zip(world.suppliers[:-1], world.suppliers[1:]):
-        assert len(set(s1).intersection(set(s2))) == 0
+        assert set(s1).isdisjoint(s2)
     for s1, s2 in zip(world.consumers[:-1], world.consumers[1:]):
-        assert len(set(s1).intersection(set(s2))) == 0
+        assert set(s1).isdisjoint(s2)
     for p in range(n_processes):
         assert len(world.suppliers[p + 1]) == n_agents_per_process
         assert len(world.consumers[p]) == n_agents_per_process
@@ -285,3 +285,21 @@ def test_graphs_lead_to_no_unknown_nodes():
         construct_graphs=True,
     )
     world.graph((0, world.n_steps))
+
+
+def test_lazy_names_match_agents_and_utils():
+    import scml.scml2020
+    from scml.scml2020 import agents, utils
+
+    lazy = [_ for _, module in scml.scml2020._lazy.items() if module is not None]
+    assert lazy == agents.__all__ + utils.__all__
+    assert set(agents.__all__).issubset(scml.scml2020.__all__)
+    assert "importlib" not in dir(scml.scml2020)
+
+
+def test_scml_namespace_lists_all_scml2020_names():
+    import scml
+
+    assert set(scml.__all__).issubset(dir(scml))
+    assert scml.SCML2020World is SCML2020World
+    assert scml.DecentralizingAgent is DecentralizingAgent
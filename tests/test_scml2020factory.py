@@ -21,6 +21,8 @@ LINES = 10
 STEPS = 50
 INITIAL = 1000
 
+_rng = np.random.default_rng(0)
+
 
 def create_factory():
     return Factory(
@@ -40,12 +42,12 @@ def create_factory():
         production_no_bankruptcy=True,
         production_penalty=0.15,
         production_buy_missing=False,
-        catalog_prices=np.random.randint(1, 20, size=PROCESSES + 1, dtype=int),
+        catalog_prices=_rng.integers(1, 20, size=PROCESSES + 1, dtype=int),
     )
 
 
 def create_profile():
-    return FactoryProfile(np.random.randint(1, 10, (LINES, PROCESSES), dtype=int))
+    return FactoryProfile(_rng.integers(1, 10, (LINES, PROCESSES), dtype=int))
 
 
 def create_world():
@@ -51,10 +51,13 @@ class MyAgent9(BaseAgent):
     pass
 
 
+ALL_AGENTS = tuple(globals()[f"MyAgent{i}"] for i in range(10))
+
+
 # @pytest.mark.parametrize("n", [2])
 @pytest.mark.parametrize("n", [2, 3])
 def test_std(n):
-    competitors = [eval(f"MyAgent{_}") for _ in range(n)]
+    competitors = list(ALL_AGENTS[:n])
     results = anac2020_std(
         competitors=competitors,
         n_steps=10,
@@ -76,7 +79,7 @@ def test_std(n):
 
 @pytest.mark.parametrize("n", [2, 3])
 def test_collusion(n):
-    competitors = [eval(f"MyAgent{_}") for _ in range(n)]
+    competitors = list(ALL_AGENTS[:n])
     results = anac2020_collusion(
         competitors=competitors,
         n_steps=10,
@@ -98,7 +101,7 @@ def test_collusion(n):
 
 @pytest.mark.parametrize("n", [2, 3])
 def test_std21(n):
-    competitors = [eval(f"MyAgent{_}") for _ in range(n)]
+    competitors = list(ALL_AGENTS[:n])
     results = anac2021_std(
         competitors=competitors,
         n_steps=10,
@@ -120,7 +123,7 @@ def test_std21(n):
 
 @pytest.mark.parametrize("n", [2, 3])
 def test_collusion21(n):
-    competitors = [eval(f"MyAgent{_}") for _ in range(n)]
+    competitors = list(ALL_AGENTS[:n])
     results = anac2021_collusion(
         competitors=competitors,
         n_steps=10,
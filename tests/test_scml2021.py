@@ -1,12 +1,15 @@
 import random
+from collections import defaultdict
 
 import hypothesis.strategies as st
 from hypothesis import example
 from hypothesis import given
 from hypothesis import settings
 from negmas import save_stats
+from negmas.situated import WorldMonitor
 from negmas.helpers import unique_name
 from pytest import mark
+import pytest
 
 import scml
 from scml.oneshot.agents import RandomOneShotAgent
@@ -16,6 +19,7 @@ from scml.scml2020 import DoNothingAgent
 from scml.scml2020 import RandomAgent
 from scml.scml2020 import SCML2021World
 from scml.scml2020 import is_system_agent
+from scml.scml2020.agent import OneShotAdapter
 from scml.scml2020.agents.decentralizing import DecentralizingAgent
 
 random.seed(0)
@@ -53,9 +57,9 @@ def generate_world(
         )
     )
     for s1, s2 in zip(world.suppliers[:-1], world.suppliers[1:]):
-        assert len(set(s1).intersection(set(s2))) == 0
+        assert set(s1).isdisjoint(s2)
     for s1, s2 in zip(world.consumers[:-1], world.consumers[1:]):
-        assert len(set(s1).intersection(set(s2))) == 0
+        assert set(s1).isdisjoint(s2)
     for p in range(n_processes):
         assert len(world.suppliers[p + 1]) == n_agents_per_process
         assert len(world.consumers[p]) == n_agents_per_process
@@ -308,3 +312,64 @@ def test_adapter(atype):
         construct_graphs=False,
     )
     world.run()
+
+
+class SignedContractsMonitor(WorldMonitor):
+    """Records what embedded one-shot agents see at the end of every step"""
+
+    def init(self, world):
+        self.signed, self.utility = defaultdict(dict), defaultdict(dict)
+
+    def step(self, world):
+        s = world.current_step
+        for aid, agent in world.agents.items():
+            if not isinstance(agent, OneShotAdapter):
+                continue
+            awi = agent._obj.awi
+            self.signed[aid][s] = {_.id for _ in awi.current_signed_contracts}
+            self.utility[aid][s] = agent._obj.ufun.from_contracts()
+
+
+def test_embedded_oneshot_agent_sees_signed_contracts():
+    world = SCML2021World(
+        **SCML2021World.generate(
+            agent_types=[RandomOneShotAgent, DecentralizingAgent], n_steps=10
+        ),
+        construct_graphs=False,
+    )
+    monitor = SignedContractsMonitor()
+    world.register_world_monitor(monitor)
+    adapters = {
+        aid: agent
+        for aid, agent in world.agents.items()
+        if isinstance(agent, OneShotAdapter)
+    }
+    assert adapters
+    seen_empty = seen_signed = False
+    for s in range(world.n_steps):
+        world.step()
+        for aid, agent in adapters.items():
+            contracts = [
+                _
+                for _ in world.saved_contracts
+                if _["signed_at"] == s and aid in (_["seller"], _["buyer"])
+            ]
+            assert monitor.signed[aid][s] == {_["id"] for _ in contracts}
+            assert monitor.utility[aid][s] == pytest.approx(
+                agent._obj.ufun.from_offers(
+                    [
+                        dict(
+                            quantity=_["quantity"],
+                            time=_["delivery_time"],
+                            unit_price=_["unit_price"],
+                        )
+                        for _ in contracts
+                    ],
+                    [_["seller"] == aid for _ in contracts],
+                )
+            )
+            # nothing is signed yet in the step that just started
+            assert agent._obj.awi.current_signed_contracts == []
+            seen_empty = seen_empty or not contracts
+            seen_signed = seen_signed or bool(contracts)
+    assert seen_empty and seen_signed
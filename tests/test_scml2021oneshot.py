@@ -1,6 +1,7 @@
 import random
 
 import hypothesis.strategies as st
+import numpy as np
 from hypothesis import given
 from hypothesis import settings
 from negmas import save_stats
@@ -51,9 +52,9 @@ def generate_world(
         )
     )
     for s1, s2 in zip(world.suppliers[:-1], world.suppliers[1:]):
-        assert len(set(s1).intersection(set(s2))) == 0
+        assert set(s1).isdisjoint(s2)
     for s1, s2 in zip(world.consumers[:-1], world.consumers[1:]):
-        assert len(set(s1).intersection(set(s2))) == 0
+        assert set(s1).isdisjoint(s2)
     for p in range(n_processes):
         assert len(world.suppliers[p + 1]) == n_agents_per_process
         assert len(world.consumers[p]) == n_agents_per_process
@@ -200,6 +201,70 @@ def test_ufun_min_max():
         assert mx > mn or mx == mn == 0
 
 
+def test_ufun_batch_matches_scalar():
+    world = SCML2020OneShotWorld(
+        **SCML2020OneShotWorld.generate(agent_types=[RandomOneShotAgent], n_steps=10),
+        construct_graphs=True,
+    )
+    world.step()
+    for aid, agent in world.agents.items():
+        if is_system_agent(aid):
+            continue
+        ufun = agent.make_ufun(add_exogenous=True)
+        qs = np.arange(0, 2 * agent.awi.n_lines)
+        batch = ufun.from_aggregates_batch(qs, qs[::-1], 10 * qs, 12 * qs[::-1])
+        for i, q in enumerate(qs):
+            assert batch[i] == pytest.approx(
+                ufun.from_aggregates(q, qs[-1 - i], 10 * q, 12 * qs[-1 - i])
+            )
+
+
+class SignedContractsRecorder(RandomOneShotAgent):
+    def init(self):
+        super().init()
+        self.signed, self.utility = dict(), dict()
+
+    def step(self):
+        super().step()
+        s = self.awi.current_step
+        self.signed[s] = {_.id for _ in self.awi.current_signed_contracts}
+        self.utility[s] = self.ufun.from_contracts()
+
+
+def test_ufun_of_signed_contracts():
+    world = generate_world([SignedContractsRecorder], n_steps=10)
+    seen_empty = seen_signed = False
+    for s in range(world.n_steps):
+        world.step()
+        for aid, agent in world.agents.items():
+            if is_system_agent(aid):
+                continue
+            contracts = [
+                _
+                for _ in world.saved_contracts
+                if _["signed_at"] == s and aid in (_["seller"], _["buyer"])
+            ]
+            assert agent._obj.signed[s] == {_["id"] for _ in contracts}
+            assert agent._obj.utility[s] == pytest.approx(
+                agent._obj.ufun.from_offers(
+                    [
+                        dict(
+                            quantity=_["quantity"],
+                            time=_["delivery_time"],
+                            unit_price=_["unit_price"],
+                        )
+                        for _ in contracts
+                    ],
+                    [_["seller"] == aid for _ in contracts],
+                )
+            )
+            # nothing is signed yet in the step that just started
+            assert agent.awi.current_signed_contracts == []
+            seen_empty = seen_empty or not contracts
+            seen_signed = seen_signed or bool(contracts)
+    assert seen_empty and seen_signed
+
+
 def test_builtin_agent_types():
     from negmas.helpers import get_full_type_name
 
@@ -46,9 +46,12 @@ class MyAgent9(RandomOneShotAgent):
     pass
 
 
+ALL_AGENTS = tuple(globals()[f"MyAgent{i}"] for i in range(10))
+
+
 @pytest.mark.parametrize("n", [2, 3])
 def test_oneshot(n):
-    competitors = [eval(f"MyAgent{_}") for _ in range(n)]
+    competitors = list(ALL_AGENTS[:n])
     results = anac2021_oneshot(
         competitors=competitors,
         n_steps=10,